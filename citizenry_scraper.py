@@ -1,35 +1,62 @@
 import requests
-import json
+import requests_cache
+import orjson
 import time
 import logging
 import os
 import csv
 import re
+import random
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from dotenv import load_dotenv
 from datetime import datetime
-from urllib.parse import urljoin, urlparse
+from dataclasses import dataclass, field
+from urllib.parse import urljoin
 import signal
+import argparse
+from requests.adapters import HTTPAdapter
 
 def signal_handler(sig, frame):
     logger.warning("Script interrupted by user via SIGINT (Ctrl+C)")
     print("\nExiting due to user interrupt (Ctrl+C)...")
+    # os._exit skips main()'s finally, so keep this run's image validators here
+    try:
+        save_image_cache()
+    except Exception as e:
+        logger.error(f"Failed to save image cache: {e}")
     os._exit(0)
 
 signal.signal(signal.SIGINT, signal_handler)
 
 load_dotenv()
 
-# Create output directory
-output_dir = Path("./citizenry_data")
-output_dir.mkdir(exist_ok=True, parents=True)
+@dataclass(frozen=True)
+class Paths:
+    """Output locations, resolved once at startup"""
+    output_dir: Path
+    images_dir: Path
+    # images_dir with a trailing separator, so image paths are built by plain string concatenation
+    images_str: str = field(init=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'images_str', str(self.images_dir) + os.sep)
+    
+    @classmethod
+    def create(cls, output_dir):
+        """Create the output and images directories and return their paths"""
+        images_dir = output_dir / "images"
+        images_dir.mkdir(exist_ok=True, parents=True)
+        return cls(output_dir, images_dir)
 
-# Create images directory
-images_dir = output_dir / "images"
-images_dir.mkdir(exist_ok=True, parents=True)
+# Created at import time because the log file, the FireCrawl response cache and the image
+# validator sidecar below are all set up before main() runs
+paths = Paths.create(Path("./citizenry_data"))
 
 # Setup logging
-log_file = output_dir / f"citizenry_scrape_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+log_file = paths.output_dir / f"citizenry_scrape_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
 logger = logging.getLogger('CitizenryProductScraper')
 logger.setLevel(logging.INFO)
 
@@ -50,6 +77,10 @@ if not API_KEY:
     exit(1)
 
 FIRECRAWL_API_URL = "https://api.firecrawl.dev/v1/scrape"
+FIRECRAWL_MAP_URL = "https://api.firecrawl.dev/v1/map"
+
+# Fewer product URLs than this from /map means it missed most of the catalog
+MIN_MAPPED_PRODUCTS = 20
 
 headers = {
     "Authorization": f"Bearer {API_KEY}",
@@ -57,38 +88,255 @@ headers = {
     "User-Agent": "CitizenryProductScraper/1.0"
 }
 
+# Server-side page load timeout passed to FireCrawl, in milliseconds
+SCRAPE_TIMEOUT_MS = 60000
+
 BASE_URL = "https://www.the-citizenry.com"
 
-def make_request_with_retry(url, payload, max_retries=3):
+# Explicit schemas let FireCrawl return structured JSON directly instead of free-form prompt output
+PRODUCT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string", "description": "product title/name"},
+        "current_price": {"type": "string", "description": "current price"},
+        "original_price": {
+            "type": ["string", "null"],
+            "description": "original price if discounted, null if not"
+        },
+        "description": {"type": "string", "description": "full product description text"},
+        "images": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "image URLs of the product"
+        },
+        "colors_sizes": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "available colors/sizes/variants"
+        },
+        "upsells": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "related/recommended products or 'complete the set' items"
+        },
+        "sustainability_text": {
+            "type": ["string", "null"],
+            "description": "any text mentioning sustainability, ethical sourcing, handmade, artisan, etc."
+        }
+    },
+    "required": ["name"]
+}
+
+def product_urls_schema(key):
+    """Schema for a page's product links, returned as a list under `key`"""
+    return {
+        "type": "object",
+        "properties": {
+            key: {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "all links to product pages (URLs containing '/products/')"
+            }
+        },
+        "required": [key]
+    }
+
+WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB
+
+KEYWORDS = ['Fairtrade', 'FSC', 'Handmade', 'Artisan', 'Sustainable', 'Organic', 'Eco-friendly']
+KEYWORDS_CANON = {keyword.lower(): keyword for keyword in KEYWORDS}
+# Substring match (no word boundaries) so e.g. "artisans" still counts as Artisan.
+# ASCII-only case folding keeps every match a key of KEYWORDS_CANON (no "ſ" or "İ" matches).
+KEYWORD_RE = re.compile('|'.join(re.escape(keyword) for keyword in KEYWORDS), re.IGNORECASE | re.ASCII)
+
+_FNAME_STRIP = re.compile(r'[^\w\s-]')
+_FNAME_SQUASH = re.compile(r'[-\s]+')
+
+def create_session(session=None):
+    """Create a session that keeps connections to a host alive between requests"""
+    session = session or requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=0)
+    session.mount("https://", adapter)
+    return session
+
+# Reused across calls so only the first request to each host pays for the TLS handshake
+# FireCrawl responses are cached on disk for a day. The cache key includes the POST body,
+# so each payload is cached separately.
+api_session = create_session(requests_cache.CachedSession(
+    cache_name=str(paths.output_dir / "firecrawl_cache"),
+    backend="sqlite",
+    expire_after=86400,
+    allowable_methods=("GET", "HEAD", "POST"),
+))
+api_session.headers.update(headers)
+
+img_session = create_session()
+
+MAX_WORKERS = 6
+
+# Shared by API calls and image downloads so at most MAX_WORKERS requests are in flight
+request_slots = threading.Semaphore(MAX_WORKERS)
+
+class TokenBucket:
+    """Thread-safe token bucket limiting how often requests may start"""
+    
+    def __init__(self, rate, capacity):
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self.restore_at = None
+        self.lock = threading.Lock()
+    
+    def _refill(self, now):
+        if self.restore_at is not None and now >= self.restore_at:
+            self.rate = self.base_rate
+            self.restore_at = None
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+    
+    def acquire(self):
+        """Block until a token is available, then consume it"""
+        while True:
+            with self.lock:
+                self._refill(time.monotonic())
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_time = (1 - self.tokens) / self.rate
+            time.sleep(wait_time)
+    
+    def back_off(self, duration=60):
+        """Halve the rate for `duration` seconds after the server pushes back"""
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            # Concurrent 429s while already backed off only extend the slowdown
+            if self.restore_at is None:
+                self.rate = self.base_rate / 2
+                logger.warning(f"Reducing request rate to {self.rate:.2f}/s for {duration} seconds")
+            self.restore_at = now + duration
+
+try:
+    FIRECRAWL_RPS = float(os.getenv("FIRECRAWL_RPS", "2"))
+except ValueError:
+    FIRECRAWL_RPS = 0
+if not 0 < FIRECRAWL_RPS < float('inf'):
+    logger.critical(f"FIRECRAWL_RPS must be a number greater than 0, got {os.getenv('FIRECRAWL_RPS')!r}")
+    exit(1)
+rate_limiter = TokenBucket(rate=FIRECRAWL_RPS, capacity=max(1, FIRECRAWL_RPS))
+
+try:
+    MAX_RETRIES = int(os.getenv("FIRECRAWL_MAX_RETRIES", "3"))
+except ValueError:
+    MAX_RETRIES = 0
+if MAX_RETRIES < 1:
+    logger.critical(f"FIRECRAWL_MAX_RETRIES must be an integer of at least 1, got {os.getenv('FIRECRAWL_MAX_RETRIES')!r}")
+    exit(1)
+MAX_BACKOFF = 300
+
+class RateLimitError(Exception):
+    """Raised when a FireCrawl request still fails after all retries"""
+
+def backoff_time(attempt):
+    """Exponential backoff with full jitter so concurrent retries don't line up"""
+    return random.uniform(0, min(MAX_BACKOFF, 30 * (2 ** attempt)))
+
+def retry_after_time(response, attempt):
+    """Honor the server's Retry-After header, falling back to jittered backoff"""
+    retry_after = response.headers.get('Retry-After')
+    if retry_after and retry_after.isdigit():
+        return int(retry_after)
+    return backoff_time(attempt)
+
+def is_cached(url, payload):
+    """Check whether an unexpired response for this request is in the local cache"""
+    request = api_session.prepare_request(requests.Request('POST', url, json=payload))
+    cached_response = api_session.cache.get_response(api_session.cache.create_key(request))
+    return cached_response is not None and not cached_response.is_expired
+
+def make_request_with_retry(url, payload, max_retries=MAX_RETRIES):
+    last_error = None
+    # Cache hits never reach FireCrawl, so they don't count against the rate limit
+    cached = is_cached(url, payload)
     for attempt in range(max_retries):
+        if not cached:
+            rate_limiter.acquire()
         try:
-            response = requests.post(url, headers=headers, json=payload, timeout=120)
+            with request_slots:
+                response = api_session.post(url, json=payload, timeout=120)
             
             if response.status_code == 429:
-                wait_time = int(response.headers.get('Retry-After', 30))
-                logger.warning(f"Rate limited. Waiting {wait_time} seconds.")
-                time.sleep(wait_time)
-                continue
-                
-            if response.status_code >= 500:
-                wait_time = 30 * (2 ** attempt)
-                logger.warning(f"Server error {response.status_code}. Waiting {wait_time} seconds.")
-                time.sleep(wait_time)
-                continue
-                
-            return response
+                rate_limiter.back_off()
+                last_error = "Rate limited"
+                wait_time = retry_after_time(response, attempt)
+            elif response.status_code >= 500:
+                last_error = f"Server error {response.status_code}"
+                wait_time = retry_after_time(response, attempt)
+            else:
+                return response
             
         except requests.exceptions.RequestException as e:
-            wait_time = 30 * (2 ** attempt)
-            logger.error(f"Request failed: {e}. Waiting {wait_time} seconds.")
+            last_error = f"Request failed: {e}"
+            wait_time = backoff_time(attempt)
+        
+        if attempt < max_retries - 1:
+            logger.warning(f"{last_error}. Waiting {wait_time:.1f} seconds.")
             time.sleep(wait_time)
+        else:
+            logger.error(f"{last_error}. Giving up after {max_retries} attempts.")
     
-    return None
+    raise RateLimitError(f"Giving up on {payload.get('url', url)} after {max_retries} attempts: {last_error}")
 
 def discover_product_urls():
-    """Discover product URLs by scraping multiple collection pages"""
+    """Discover product URLs with a single site map call, scraping collections if it falls short"""
     logger.info("Starting product URL discovery...")
     
+    product_urls = discover_mapped_urls()
+    if len(product_urls) >= MIN_MAPPED_PRODUCTS:
+        return product_urls
+    
+    logger.warning(f"Site map returned only {len(product_urls)} product URLs, scraping collection pages instead")
+    return discover_collection_urls()
+
+def discover_mapped_urls():
+    """Discover product URLs from FireCrawl's site map in one request"""
+    payload = {
+        "url": BASE_URL,
+        "includeSubdomains": False,
+        "search": "products",
+        "limit": 5000
+    }
+    
+    try:
+        response = make_request_with_retry(FIRECRAWL_MAP_URL, payload)
+    except RateLimitError as e:
+        logger.error(f"Site map discovery failed: {e}")
+        return []
+    
+    if response.status_code != 200:
+        logger.error(f"Site map discovery failed with status {response.status_code}")
+        return []
+    
+    try:
+        links = orjson.loads(response.content).get('links', [])
+    except Exception as e:
+        logger.error(f"Error parsing site map: {e}")
+        return []
+    
+    unique_urls = set()
+    for url in links:
+        if url and isinstance(url, str) and '/products/' in url:
+            if url.startswith('/'):
+                url = BASE_URL + url
+            unique_urls.add(url.split('?')[0])
+    
+    logger.info(f"Discovered {len(unique_urls)} unique product URLs from site map")
+    return list(unique_urls)
+
+def discover_collection_urls():
+    """Discover product URLs by scraping multiple collection pages"""
     collection_urls = [
         f"{BASE_URL}/collections/all",
         f"{BASE_URL}/collections/accents",
@@ -113,17 +361,20 @@ def discover_product_urls():
             "url": collection_url,
             "formats": ["json"],
             "onlyMainContent": True,
-            "jsonOptions": {
-                "prompt": "Find all product links on this page. Look for URLs containing '/products/'. Return as JSON: {\"product_urls\": [\"url1\", \"url2\"]}",
-                "temperature": 0.0
-            }
+            "timeout": SCRAPE_TIMEOUT_MS,
+            "jsonOptions": {"schema": product_urls_schema("product_urls")}
         }
         
-        response = make_request_with_retry(FIRECRAWL_API_URL, payload)
-        if response and response.status_code == 200:
+        try:
+            response = make_request_with_retry(FIRECRAWL_API_URL, payload)
+        except RateLimitError as e:
+            logger.error(f"Skipping collection {collection_url}: {e}")
+            continue
+        
+        if response.status_code == 200:
             try:
-                data = response.json().get('data', {})
-                product_data = data.get('json', {}) if 'json' in data else data
+                data = orjson.loads(response.content).get('data', {})
+                product_data = data.get('json') or {}
                 urls = product_data.get('product_urls', [])
                 
               
@@ -138,8 +389,6 @@ def discover_product_urls():
                 
             except Exception as e:
                 logger.error(f"Error parsing collection {collection_url}: {e}")
-        
-        time.sleep(1)
     
     product_urls = list(all_product_urls)
     logger.info(f"Discovered {len(product_urls)} unique product URLs from all collections")
@@ -166,17 +415,20 @@ def discover_fallback_urls():
         "url": BASE_URL,
         "formats": ["json"],
         "onlyMainContent": True,
-        "jsonOptions": {
-            "prompt": "Find all links to product pages (containing '/products/'). Return as JSON: {\"urls\": [\"url1\", \"url2\"]}",
-            "temperature": 0.0
-        }
+        "timeout": SCRAPE_TIMEOUT_MS,
+        "jsonOptions": {"schema": product_urls_schema("urls")}
     }
     
-    response = make_request_with_retry(FIRECRAWL_API_URL, payload)
-    if response and response.status_code == 200:
+    try:
+        response = make_request_with_retry(FIRECRAWL_API_URL, payload)
+    except RateLimitError as e:
+        logger.error(f"Fallback discovery failed: {e}")
+        return []
+    
+    if response.status_code == 200:
         try:
-            data = response.json().get('data', {})
-            product_data = data.get('json', {}) if 'json' in data else data
+            data = orjson.loads(response.content).get('data', {})
+            product_data = data.get('json') or {}
             urls = product_data.get('urls', [])
             
             product_urls = []
@@ -197,27 +449,53 @@ def extract_keywords(text):
     if not text:
         return []
     
-    keywords = ['Fairtrade', 'FSC', 'Handmade', 'Artisan', 'Sustainable', 'Organic', 'Eco-friendly']
-    found_keywords = []
-    
-    text_lower = text.lower()
-    for keyword in keywords:
-        if keyword.lower() in text_lower:
-            found_keywords.append(keyword)
-    
-    return found_keywords
+    found = {KEYWORDS_CANON[match.lower()] for match in KEYWORD_RE.findall(text)}
+    return [keyword for keyword in KEYWORDS if keyword in found]
 
 def clean_filename(name):
     """Clean product name for use as filename"""
-    if not name:
-        return "unknown_product"
-    
-    cleaned = re.sub(r'[^\w\s-]', '', name)
-    cleaned = re.sub(r'[-\s]+', '_', cleaned)
-    return cleaned[:50]  
+    return _FNAME_SQUASH.sub('_', _FNAME_STRIP.sub('', name))[:50] if name else "unknown_product"
+
+# Image file extension at the end of the URL path, ignoring any query string or fragment
+_EXT_RE = re.compile(r'\.(jpe?g|png|webp|gif|avif)(?:[?#]|$)', re.IGNORECASE)
+
+# Validators (ETag/Last-Modified) of downloaded images, keyed by image URL
+etags_file = paths.images_dir / ".etags.json"
+# Reentrant so the SIGINT handler can save while the main thread is already saving
+etags_lock = threading.RLock()
 
-def download_image(image_url, filename):
-    """Download product image"""
+def load_image_cache():
+    """Load image validators saved by previous runs"""
+    try:
+        return orjson.loads(etags_file.read_bytes())
+    except FileNotFoundError:
+        return {}
+    except orjson.JSONDecodeError as e:
+        logger.warning(f"Ignoring unreadable image cache {etags_file}: {e}")
+        return {}
+
+image_cache = load_image_cache()
+
+def record_image_validators(image_url, file_path, response):
+    """Remember where an image was saved and how to revalidate it next run"""
+    entry = {'path': file_path}
+    if response.headers.get('ETag'):
+        entry['etag'] = response.headers['ETag']
+    if response.headers.get('Last-Modified'):
+        entry['last_modified'] = response.headers['Last-Modified']
+    
+    with etags_lock:
+        image_cache[image_url] = entry
+
+def save_image_cache():
+    """Write image validators to disk so the next run can revalidate instead of re-downloading"""
+    with etags_lock:
+        tmp_file = etags_file.with_suffix('.tmp')
+        tmp_file.write_bytes(orjson.dumps(image_cache, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_file, etags_file)
+
+def download_image(image_url, filename, output_paths):
+    """Download product image, reusing a previously downloaded copy when possible"""
     try:
         if not image_url:
             return None
@@ -228,23 +506,46 @@ def download_image(image_url, filename):
         elif image_url.startswith('/'):
             image_url = urljoin(BASE_URL, image_url)
         
-        response = requests.get(image_url, timeout=30)
-        if response.status_code == 200:
-            parsed_url = urlparse(image_url)
-            ext = os.path.splitext(parsed_url.path)[1] or '.jpg'
-            
-            file_path = images_dir / f"{filename}{ext}"
-            with open(file_path, 'wb') as f:
-                f.write(response.content)
+        match = _EXT_RE.search(image_url)
+        ext = '.' + match.group(1).lower() if match else '.jpg'
+        file_path = f"{output_paths.images_str}{filename}{ext}"
+        
+        if os.path.exists(file_path) and os.path.getsize(file_path) > 0:
+            logger.info(f"Image already downloaded: {file_path}")
+            return file_path
+        
+        # The same image may already be saved under another product's name
+        request_headers = {}
+        cached = image_cache.get(image_url)
+        if cached and os.path.exists(cached['path']):
+            if 'etag' in cached:
+                request_headers['If-None-Match'] = cached['etag']
+            if 'last_modified' in cached:
+                request_headers['If-Modified-Since'] = cached['last_modified']
+        
+        with request_slots, img_session.get(image_url, headers=request_headers, timeout=30, stream=True) as response:
+            if response.status_code == 304:
+                logger.info(f"Image not modified, reusing: {cached['path']}")
+                return cached['path']
             
-            logger.info(f"Downloaded image: {file_path}")
-            return str(file_path)
+            if response.status_code == 200:
+                # Write to a temporary file first so an interrupted download never looks complete
+                part_path = file_path + '.part'
+                # Undo any Content-Encoding while streaming the raw body to disk
+                response.raw.decode_content = True
+                with open(part_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                    shutil.copyfileobj(response.raw, f, length=WRITE_BUFFER_SIZE)
+                os.replace(part_path, file_path)
+                record_image_validators(image_url, file_path, response)
+                
+                logger.info(f"Downloaded image: {file_path}")
+                return file_path
     except Exception as e:
         logger.error(f"Failed to download image {image_url}: {e}")
     
     return None
 
-def scrape_product(product_url):
+def scrape_product(product_url, output_paths):
     """Scrape individual product data"""
     logger.info(f"Scraping product: {product_url}")
     
@@ -252,37 +553,22 @@ def scrape_product(product_url):
         "url": product_url,
         "formats": ["json"],
         "onlyMainContent": True,
-        "jsonOptions": {
-            "prompt": """
-            Extract product information in JSON format:
-            {
-                "name": "product title/name",
-                "current_price": "current price",
-                "original_price": "original price if discounted, null if not",
-                "description": "full product description text",
-                "images": ["array of image URLs"],
-                "colors_sizes": ["array of available colors/sizes/variants"],
-                "upsells": ["array of related/recommended products or 'complete the set' items"],
-                "sustainability_text": "any text mentioning sustainability, ethical sourcing, handmade, artisan, etc."
-            }
-            Return null for missing fields.
-            """,
-            "temperature": 0.0
-        }
+        "timeout": SCRAPE_TIMEOUT_MS,
+        "jsonOptions": {"schema": PRODUCT_SCHEMA}
     }
     
     response = make_request_with_retry(FIRECRAWL_API_URL, payload)
-    if not response or response.status_code != 200:
+    if response.status_code != 200:
         logger.error(f"Failed to scrape {product_url}")
         return None
     
     try:
-        data = response.json().get('data', {})
+        data = orjson.loads(response.content).get('data', {})
         if not data:
             return None
         
         # Extract product info
-        product_data = data.get('json', {}) if 'json' in data else data
+        product_data = data.get('json') or {}
         
         name = product_data.get('name', 'Unknown Product')
         current_price = product_data.get('current_price', '')
@@ -306,7 +592,7 @@ def scrape_product(product_url):
         image_path = None
         if images and len(images) > 0:
             clean_name = clean_filename(name)
-            image_path = download_image(images[0], clean_name)
+            image_path = download_image(images[0], clean_name, output_paths)
         
         # Format arrays as comma-separated strings
         keywords_str = ', '.join(keywords) if keywords else ''
@@ -328,33 +614,64 @@ def scrape_product(product_url):
         logger.error(f"Error processing product data for {product_url}: {e}")
         return None
 
-def save_to_csv(products, filename):
-    """Save products to CSV file"""
-    if not products:
-        logger.warning("No products to save")
-        return
-    
-    csv_file = output_dir / filename
-    
-    fieldnames = [
-        'Name', 
-        'Price', 
-        'Description of product', 
-        'Original URL', 
-        'Keywords', 
-        'Stretch goals', 
-        'Alternative sizes or colors available'
-    ]
-    
-    with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        
-        for product in products:
-            row = {field: product.get(field, '') for field in fieldnames}
-            writer.writerow(row)
-    
-    logger.info(f"Saved {len(products)} products to {csv_file}")
+CSV_FIELDNAMES = [
+    'Name', 
+    'Price', 
+    'Description of product', 
+    'Original URL', 
+    'Keywords', 
+    'Stretch goals', 
+    'Alternative sizes or colors available'
+]
+
+class IncrementalCSVWriter:
+    """CSV file kept open for the whole scrape, written one product at a time"""
+    
+    def __init__(self, file_path, fieldnames=CSV_FIELDNAMES):
+        self.file = open(file_path, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE)
+        self.fieldnames = fieldnames
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(fieldnames)
+        self.lock = threading.Lock()
+        self.count = 0
+    
+    def write(self, product):
+        with self.lock:
+            # Plain list in fieldnames order, skipping DictWriter's per-row mapping
+            self.writer.writerow([product.get(fieldname, '') for fieldname in self.fieldnames])
+            # Flush per product so an interrupted scrape keeps everything written so far
+            self.file.flush()
+            self.count += 1
+    
+    def close(self):
+        with self.lock:
+            if self.file.closed:
+                return
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.file.close()
+
+class IncrementalJSONLWriter:
+    """JSONL file (one JSON object per line) kept open for the whole scrape"""
+    
+    def __init__(self, file_path):
+        self.file = open(file_path, 'wb', buffering=WRITE_BUFFER_SIZE)
+        self.lock = threading.Lock()
+        self.count = 0
+    
+    def write(self, product):
+        with self.lock:
+            self.file.write(orjson.dumps(product) + b'\n')
+            self.file.flush()
+            self.count += 1
+    
+    def close(self):
+        with self.lock:
+            if self.file.closed:
+                return
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.file.close()
 
 def main():
     logger.info("Starting Citizenry product scraper")
@@ -368,38 +685,67 @@ def main():
     
     logger.info(f"Found {len(product_urls)} products to scrape")
     
-    products = []
-    failed_count = 0
-    
-    for i, url in enumerate(product_urls, 1):
-        logger.info(f"Processing product {i}/{len(product_urls)}")
-        
-        product_data = scrape_product(url)
-        if product_data:
-            products.append(product_data)
-            logger.info(f"Successfully scraped: {product_data['Name']}")
-        else:
-            failed_count += 1
-            logger.warning(f"Failed to scrape: {url}")
-        
-        time.sleep(2)
-    
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     csv_filename = f"citizenry_products_{timestamp}.csv"
-    save_to_csv(products, csv_filename)
+    json_filename = f"citizenry_products_detailed_{timestamp}.jsonl"
+    csv_writer = IncrementalCSVWriter(paths.output_dir / csv_filename)
+    json_writer = IncrementalJSONLWriter(paths.output_dir / json_filename)
     
-    json_filename = f"citizenry_products_detailed_{timestamp}.json"
-    json_file = output_dir / json_filename
-    with open(json_file, 'w', encoding='utf-8') as f:
-        json.dump(products, f, indent=2, ensure_ascii=False)
+    failed_count = 0
+    gave_up_count = 0
     
-    logger.info(f"Scraping completed. Success: {len(products)}, Failed: {failed_count}")
+    try:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = {executor.submit(scrape_product, url, paths): url for url in product_urls}
+            
+            for i, future in enumerate(as_completed(futures), 1):
+                url = futures[future]
+                logger.info(f"Processed product {i}/{len(product_urls)}")
+                
+                try:
+                    product_data = future.result()
+                except RateLimitError as e:
+                    logger.error(f"Gave up on {url}: {e}")
+                    gave_up_count += 1
+                    product_data = None
+                except Exception as e:
+                    logger.error(f"Error scraping {url}: {e}")
+                    product_data = None
+                
+                if product_data:
+                    csv_writer.write(product_data)
+                    json_writer.write(product_data)
+                    logger.info(f"Successfully scraped: {product_data['Name']}")
+                else:
+                    failed_count += 1
+                    logger.warning(f"Failed to scrape: {url}")
+    finally:
+        csv_writer.close()
+        json_writer.close()
+        save_image_cache()
+    
+    logger.info(f"Scraping completed. Success: {csv_writer.count}, Failed: {failed_count} (gave up after retries: {gave_up_count})")
     logger.info(f"Results saved to {csv_filename} and {json_filename}")
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Scrape products from The Citizenry")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Discard cached FireCrawl responses and fetch everything again")
+    return parser.parse_args()
+
 if __name__ == "__main__":
+    args = parse_args()
     try:
+        if args.no_cache:
+            logger.info("Clearing FireCrawl response cache")
+            api_session.cache.clear()
+        else:
+            api_session.cache.delete(expired=True)
         main()
     except KeyboardInterrupt:
         logger.warning("Script interrupted by user")
     except Exception as e:
         logger.critical(f"Unhandled exception: {e}", exc_info=True)
+    finally:
+        api_session.close()
+        img_session.close()
@@ -2,9 +2,55 @@ import json
 import csv
 import os
 import glob
+import re
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
+WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB
+
+# Section headings ("### Story", "### Product Details", "### Care", ...) are always
+# followed by boilerplate on this site, so descriptions are cut at the first one
+HEADING_MARKER = '###'
+
+# Other markers that start unwanted content
+INLINE_CUTS = [
+    'Customer Reviews',
+    'Write a Review',
+    'Shipping',
+    'Returns',
+    'Easy 30 Day Returns',
+    'In stock. Ready to ship.',
+    'Translation missing:',
+    'Add To Bag',
+    'Your email address',
+    'Want early access',
+    'Ships ',
+    'Most in-stock items',
+    'Exchanges and returns',
+    'White glove delivery',
+    'For more information',
+    'Customer Photos',
+    'Ask a Question',
+    'Based on',
+    'Reviews',
+    'Was this helpful?',
+    'United States',
+    'Loading more...',
+    'Filter Reviews:',
+    'Sort'
+]
+
+# Matches the earliest occurrence of any inline marker in a single pass
+CUT_RE = re.compile('|'.join(re.escape(marker) for marker in INLINE_CUTS))
+# Maps every character str.split() treats as whitespace to a plain space
+_WS_TABLE = str.maketrans(dict.fromkeys(
+    '\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f\x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005'
+    '\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000',
+    ' '
+))
+_WS_RE = re.compile(r' {2,}')
+
 def clean_description(description):
     """
     Clean product description by removing reviews, shipping info, and other unnecessary content
@@ -12,48 +58,15 @@ def clean_description(description):
     if not description:
         return ''
     
-    sections_to_remove = [
-        '### Story',
-        '### Product Details', 
-        '### Care',
-        '### Shipping',
-        '### Returns',
-        'Customer Reviews',
-        'Write a Review',
-        'Shipping',
-        'Returns',
-        'Easy 30 Day Returns',
-        'In stock. Ready to ship.',
-        'Translation missing:',
-        'Add To Bag',
-        'Your email address',
-        'Want early access',
-        'Ships ',
-        'Most in-stock items',
-        'Exchanges and returns',
-        'White glove delivery',
-        'For more information',
-        'Customer Photos',
-        'Ask a Question',
-        'Based on',
-        'Reviews',
-        'Was this helpful?',
-        'United States',
-        'Loading more...',
-        'Filter Reviews:',
-        'Sort'
-    ]
+    # Cut everything from the first heading, then from the first inline marker in what remains
+    heading_index = description.find(HEADING_MARKER)
+    clean_desc = description[:heading_index] if heading_index != -1 else description
     
-    # Find the first occurrence of any section marker
-    clean_desc = description
-    for marker in sections_to_remove:
-        if marker in clean_desc:
-            clean_desc = clean_desc.split(marker)[0]
+    match = CUT_RE.search(clean_desc)
+    if match:
+        clean_desc = clean_desc[:match.start()]
     
-    clean_desc = clean_desc.replace('\n\n', ' ').replace('\n', ' ')
-    clean_desc = ' '.join(clean_desc.split()) 
-    
-    return clean_desc.strip()
+    return _WS_RE.sub(' ', clean_desc.translate(_WS_TABLE)).strip()
 
 def clean_price(price):
     """
@@ -65,16 +78,19 @@ def clean_price(price):
 
 def convert_citizenry_json_to_csv(json_file_path, output_csv_path=None):
     """
-    Convert citizenry_products_detailed_{timestamp}.json to CSV format
+    Convert citizenry_products_detailed_{timestamp}.json (or .jsonl) to CSV format
     """
     if not output_csv_path:
         json_path = Path(json_file_path)
         output_csv_path = json_path.parent / f"{json_path.stem}_cleaned.csv"
     
     try:
-        # Read JSON file
+        # Read JSON file (a single array, or one object per line for .jsonl)
         with open(json_file_path, 'r', encoding='utf-8') as f:
-            products = json.load(f)
+            if str(json_file_path).endswith('.jsonl'):
+                products = [json.loads(line) for line in f if line.strip()]
+            else:
+                products = json.load(f)
         
         if not products:
             print("No products found in JSON file")
@@ -92,21 +108,27 @@ def convert_citizenry_json_to_csv(json_file_path, output_csv_path=None):
         ]
         
         # Write to CSV
-        with open(output_csv_path, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
+        with open(output_csv_path, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
+            
+            # Rows are plain lists in fieldnames order, written in one writerows call
+            rows = (
+                [
+                    product.get('Name', ''),
+                    clean_price(product.get('Price', '')),
+                    clean_description(product.get('Description of product', '')),
+                    product.get('Original URL', ''),
+                    product.get('Keywords', ''),
+                    product.get('Stretch goals', ''),
+                    product.get('Alternative sizes or colors available', '')
+                ]
+                for product in products
+            )
+            writer.writerows(rows)
             
-            for product in products:
-                row = {
-                    'Name': product.get('Name', ''),
-                    'Price': clean_price(product.get('Price', '')),
-                    'Description of product': clean_description(product.get('Description of product', '')),
-                    'Original URL': product.get('Original URL', ''),
-                    'Keywords': product.get('Keywords', ''),
-                    'Stretch goals': product.get('Stretch goals', ''),
-                    'Alternative sizes or colors available': product.get('Alternative sizes or colors available', '')
-                }
-                writer.writerow(row)
+            csvfile.flush()
+            os.fsync(csvfile.fileno())
         
         print(f"Successfully converted {len(products)} products to CSV: {output_csv_path}")
         
@@ -118,10 +140,12 @@ def main():
     print("-" * 50)
     
     json_files = glob.glob("citizenry_products_detailed_*.json")
+    json_files.extend(glob.glob("citizenry_products_detailed_*.jsonl"))
     json_files.extend(glob.glob("citizenry_data/citizenry_products_detailed_*.json"))
+    json_files.extend(glob.glob("citizenry_data/citizenry_products_detailed_*.jsonl"))
     
     if not json_files:
-        json_file = input("Enter path to citizenry_products_detailed_*.json file: ").strip()
+        json_file = input("Enter path to citizenry_products_detailed_*.json(l) file: ").strip()
         if not os.path.exists(json_file):
             print(f"File not found: {json_file}")
             return
@@ -129,7 +153,10 @@ def main():
     
     for json_file in json_files:
         print(f"Processing: {json_file}")
-        convert_citizenry_json_to_csv(json_file)
+    
+    # Conversion is CPU-bound, so use one process per core rather than threads
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(convert_citizenry_json_to_csv, json_files))
 
 if __name__ == "__main__":
     main()